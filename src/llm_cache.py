@@ -0,0 +1,148 @@
+"""
+On-disk cache for LLM invocations.
+
+The workflow re-runs the same prompts frequently: the RSS headline set only
+changes once a day, so the article-selection and post-generation prompts are
+often byte-identical across runs. Caching the completions collapses those
+runs from full LLM round-trips to a local lookup.
+
+Responses are stored in a small sqlite database keyed by the SHA-256 of the
+rendered prompt. Separate namespaces keep the "select" and "generate" call
+sites from colliding on similar prompt text.
+"""
+
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Callable, List, Optional, Union
+
+# Database lives next to the other run artifacts (linkedin_post.txt, graph.png)
+CACHE_PATH = Path(".llm_cache.db")
+
+
+def _connection() -> sqlite3.Connection:
+    """Open the cache database, creating the table on first use."""
+    conn = sqlite3.connect(CACHE_PATH)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS llm_cache ("
+        "key TEXT PRIMARY KEY, namespace TEXT, prompt TEXT, response TEXT)"
+    )
+    return conn
+
+
+def _cache_key(prompt_text: str, namespace: str) -> str:
+    """Compute the lookup key for a rendered prompt within a namespace."""
+    return hashlib.sha256(f"{namespace}\x00{prompt_text}".encode("utf-8")).hexdigest()
+
+
+def _prompt_text(prompt: Union[str, List]) -> str:
+    """Render a prompt (plain string or message list) to a stable cache string."""
+    if isinstance(prompt, str):
+        return prompt
+    return "\x00".join(str(getattr(message, "content", message)) for message in prompt)
+
+
+def _lookup(key: str) -> Optional[str]:
+    """Return the cached response for a key, or None on a miss."""
+    with _connection() as conn:
+        row = conn.execute(
+            "SELECT response FROM llm_cache WHERE key = ?", (key,)
+        ).fetchone()
+    return row[0] if row else None
+
+
+def _store(key: str, namespace: str, prompt_text: str, response: str) -> None:
+    """Persist a response so future identical prompts skip the LLM call."""
+    with _connection() as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO llm_cache (key, namespace, prompt, response) "
+            "VALUES (?, ?, ?, ?)",
+            (key, namespace, prompt_text, response),
+        )
+
+
+def cached_invoke(llm, prompt: Union[str, List], namespace: str) -> str:
+    """
+    Invoke the LLM with a rendered prompt, reusing a cached response if the
+    exact same prompt was answered before.
+
+    Args:
+        llm: Chat model to invoke on a cache miss
+        prompt: Fully rendered prompt string or list of chat messages
+        namespace: Cache namespace, e.g. "select" or "generate"
+
+    Returns:
+        The response content, either cached or freshly generated
+    """
+    prompt_text = _prompt_text(prompt)
+    key = _cache_key(prompt_text, namespace)
+    cached = _lookup(key)
+    if cached is not None:
+        return cached
+
+    msg = llm.invoke(prompt)
+    _store(key, namespace, prompt_text, msg.content)
+    return msg.content
+
+
+async def cached_ainvoke(llm, prompt: Union[str, List], namespace: str) -> str:
+    """
+    Async variant of cached_invoke, for call sites that overlap several
+    LLM calls with asyncio.gather.
+
+    Args:
+        llm: Chat model to invoke on a cache miss
+        prompt: Fully rendered prompt string or list of chat messages
+        namespace: Cache namespace, e.g. "select" or "generate"
+
+    Returns:
+        The response content, either cached or freshly generated
+    """
+    prompt_text = _prompt_text(prompt)
+    key = _cache_key(prompt_text, namespace)
+    cached = _lookup(key)
+    if cached is not None:
+        return cached
+
+    msg = await llm.ainvoke(prompt)
+    _store(key, namespace, prompt_text, msg.content)
+    return msg.content
+
+
+def cached_stream(llm, prompt: Union[str, List], namespace: str,
+                  on_token: Optional[Callable[[str], None]] = None) -> str:
+    """
+    Stream the LLM response token by token, with the same caching behavior
+    as cached_invoke.
+
+    On a cache hit the stored response is delivered in a single callback;
+    on a miss every streamed chunk is forwarded to on_token as it arrives,
+    so callers can surface output incrementally instead of waiting for the
+    full generation.
+
+    Args:
+        llm: Chat model to stream from on a cache miss
+        prompt: Fully rendered prompt string or list of chat messages
+        namespace: Cache namespace, e.g. "select" or "generate"
+        on_token: Optional callback invoked with each content chunk
+
+    Returns:
+        The complete response content, either cached or freshly generated
+    """
+    prompt_text = _prompt_text(prompt)
+    key = _cache_key(prompt_text, namespace)
+    cached = _lookup(key)
+    if cached is not None:
+        if on_token:
+            on_token(cached)
+        return cached
+
+    parts = []
+    for chunk in llm.stream(prompt):
+        if chunk.content:
+            parts.append(chunk.content)
+            if on_token:
+                on_token(chunk.content)
+    response = "".join(parts)
+    _store(key, namespace, prompt_text, response)
+    return response
@@ -10,31 +10,25 @@ This module creates a workflow that:
 Based on https://langchain-ai.github.io/langgraph/tutorials/workflows/
 """
 
+import asyncio
+import functools
 import os
 from datetime import datetime
 from typing import Optional
 
-from dotenv import load_dotenv
 from langgraph.graph import StateGraph, START, END
 
-from models import get_model
 from state import State
 from nodes import (
-    fetch_ai_news_rss_node, 
+    fetch_ai_news_rss_node,
+    warm_llm_node,
     choose_relevant_article_node,
     select_article_node,
-    generate_linkedin_post_node, 
+    generate_linkedin_post_node,
     get_user_feedback_node,
     save_linkedin_post_node
 )
 
-# Load environment variables
-load_dotenv()
-
-# Determine model name and initialize the LLM
-model_name = os.getenv("MODEL", "local")
-llm = get_model("ollama/gemma2") if model_name == "local" else get_model("openai/gpt-4o-mini")
-
 def get_timestamp() -> str:
     """Get current timestamp in HH:MM:SS format."""
     return datetime.now().strftime("%H:%M:%S")
@@ -67,10 +61,15 @@ def determine_next_step(state: State) -> str:
     else:
         return "save_linkedin_post"
 
+@functools.lru_cache(maxsize=None)
 def build_workflow() -> StateGraph:
     """
     Build and configure the workflow graph.
-    
+
+    Memoized: node registration, edge wiring and schema synthesis only run
+    once per process, so repeated invocations (e.g. behind an HTTP service)
+    reuse the compiled graph.
+
     Returns:
         Compiled workflow graph
     """
@@ -79,15 +78,18 @@ def build_workflow() -> StateGraph:
 
     # Add nodes
     builder.add_node("fetch_ai_news_rss_node", fetch_ai_news_rss_node)
+    builder.add_node("warm_llm", warm_llm_node)
     builder.add_node("choose_relevant_article", choose_relevant_article_node)
     builder.add_node("select_article", select_article_node)
     builder.add_node("generate_linkedin_post", generate_linkedin_post_node)
     builder.add_node("get_user_feedback", get_user_feedback_node)
     builder.add_node("save_linkedin_post", save_linkedin_post_node)
 
-    # Add edges to connect nodes
+    # Add edges to connect nodes. The LLM warm-up runs in parallel with the
+    # RSS fetch; article selection waits for both branches to finish.
     builder.add_edge(START, "fetch_ai_news_rss_node")
-    builder.add_edge("fetch_ai_news_rss_node", "choose_relevant_article")
+    builder.add_edge(START, "warm_llm")
+    builder.add_edge(["fetch_ai_news_rss_node", "warm_llm"], "choose_relevant_article")
     builder.add_edge("choose_relevant_article", "select_article")
     builder.add_edge("select_article", "generate_linkedin_post")
     builder.add_edge("generate_linkedin_post", "get_user_feedback")
@@ -116,13 +118,15 @@ def main() -> None:
     # Build the workflow
     graph = build_workflow()
     
-    # Optional: Uncomment to save graph visualization
-    with open("graph.png", "wb") as f:
-        f.write(graph.get_graph().draw_mermaid_png())
+    # Optional: rendering goes through mermaid.ink (blocking network call),
+    # so only do it when explicitly requested
+    if os.getenv("RENDER_GRAPH") == "1":
+        with open("graph.png", "wb") as f:
+            f.write(graph.get_graph().draw_mermaid_png())
 
-    # Execute workflow
+    # Execute workflow (async so nodes can overlap I/O)
     initial_state = State(search_results=[], news_articles=[])
-    state = graph.invoke(initial_state)
+    state = asyncio.run(graph.ainvoke(initial_state))
     
     error = state.get('error')
     if error:
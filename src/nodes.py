@@ -1,21 +1,55 @@
+import asyncio
+import hashlib
+import io
 import os
+import re
+import sys
 import random
 import time
-import re
-import feedparser
+import httpx
 from datetime import datetime
+from html.parser import HTMLParser
+from typing import Optional
+from xml.etree import ElementTree
 
-from dotenv import load_dotenv
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 
-from models import get_model
+import rss_cache
+from models import default_llm
+from llm_cache import cached_ainvoke, cached_invoke, cached_stream
 from state import State, NewsArticle
 
-# Load environment variables
-load_dotenv()
-
-# Determine model name and initialize the LLM
+# The shared LLM instance (models.py loads the environment on import)
 model_name = os.getenv("MODEL", "local")
-base_llm = get_model("ollama/gemma2") if model_name == "local" else get_model("openai/gpt-4o-mini")
+base_llm = default_llm()
+
+# Scoring variant for the per-article relevance calls: a yes/no answer is a
+# single token, so cap the local decode accordingly. The cap goes through
+# the constructor (see get_model) because bind(num_predict=...) breaks on
+# the pinned langchain-ollama.
+scoring_llm = default_llm(num_predict=4) if model_name == "local" else base_llm
+
+# How many relevance calls may be in flight at once
+SCORING_CONCURRENCY = 8
+
+# Generation variant: cap the local decode length - a LinkedIn post fits
+# comfortably in 400 tokens, and the cap stops runaway generations
+generation_llm = default_llm(num_predict=400) if model_name == "local" else base_llm
+
+# Warm-up variant: loading the model and opening the connection only needs
+# one decoded token, not a full unbounded completion. OpenAI accepts the cap
+# as a bound payload param; the local cap goes through the constructor.
+warmup_llm = default_llm(num_predict=1) if model_name == "local" else base_llm.bind(max_tokens=1)
+
+# Selection only needs a rank signal, not the full article body
+SELECTION_CONTENT_CHARS = 300
+
+# Keyword prior used to rank-prune articles before the selection LLM call;
+# mirrors the relevance criteria in SELECTION_SYSTEM_PROMPT
+RELEVANCE_KEYWORDS = (
+    "breakthrough", "research", "paper", "open-source", "model",
+    "manufacturing", "computer vision", "robotics", "aerospace",
+)
 
 def get_timestamp() -> str:
     """Get current timestamp in HH:MM:SS format."""
@@ -36,7 +70,145 @@ def print_step(step_name: str, status: str = "started") -> None:
     }.get(status, "📝")
     print_with_timestamp(f"{emoji} {step_name} - {status}")
 
-def fetch_ai_news_rss_node(state: State) -> State:
+# RSS feed with daily AI news digests
+RSS_FEED_URL = "https://buttondown.com/ainews/rss"
+
+# Static relevance criteria for the per-article scoring calls. Kept in a
+# stable system message (only the article varies per call) so provider-side
+# prompt caching can reuse the prefix.
+SCORING_SYSTEM_PROMPT = """
+    Judge whether the news article provided by the user is relevant.
+    An article is relevant if it covers:
+
+    1. Scientific breakthroughs in Artificial Intelligence (new publications, new approaches, new models, new open-source libraries).
+    2. Technical innovations and disruptions in Artificial Intelligence for the domains: manufacturing, computer vision, robotics, and aerospace.
+    3. Recent news (published within the last 4 weeks).
+
+    Answer with the single word "yes" or "no".
+"""
+
+# Static style guidelines for post generation. Same idea as above: keeping the
+# long guideline block out of the user turn keeps the cacheable prefix stable.
+POST_STYLE_GUIDE = """
+    Create an engaging LinkedIn post about the article provided by the user. Follow these guidelines:
+
+    STRUCTURE:
+    1. Hook (1 line): Start with a compelling insight or observation
+    2. Context (2-3 lines): Connect the topic to real-world impact
+    3. Key Insights (2-4 lines): Share main takeaways in clear, concise points
+    4. Value (1 line): Highlight professional significance
+    5. Call to Action: End with an engaging question or prompt
+
+    WRITING STYLE:
+    - Use clear, straightforward language
+    - Write short, impactful sentences
+    - Organize ideas with bullet points
+    - Add frequent line breaks between concepts
+    - Use active voice
+    - Focus on practical, actionable insights
+    - Support points with specific examples or data
+    - Address the reader directly using "you" and "your"
+    - Pose thought-provoking questions
+    - Skip introductory phrases like "in conclusion" or "in summary"
+    - Avoid warnings, notes, or unnecessary extras
+
+    AVOID:
+    - Emojis, hashtags, semicolons, and asterisks
+    - Clichés and metaphors
+    - Broad generalizations
+    - Passive voice
+"""
+
+# Words the style guide used to ban in-prompt. Enforced client-side instead:
+# a cheap regex check plus a targeted resample costs less than carrying the
+# full list as prefix tokens on every call, and adheres better too.
+BANNED_WORDS = (
+    "Accordingly", "Additionally", "Arguably", "Certainly", "Consequently",
+    "Hence", "However", "Indeed", "Moreover", "Nevertheless", "Nonetheless",
+    "Notwithstanding", "Thus", "Undoubtedly", "Adept", "Commendable", "Dynamic",
+)
+_BANNED_WORDS_RE = re.compile(r"\b(?:" + "|".join(BANNED_WORDS) + r")\b", re.IGNORECASE)
+
+# How often to resample a post that still contains banned words
+BANNED_WORD_RETRIES = 2
+
+
+class _SummaryHTMLParser(HTMLParser):
+    """
+    Single-pass parser for the HTML summary of a feed entry.
+
+    The summary is a flat sequence of sections, each opened by an <h3> headline
+    and closed by an <hr />. One pass over the markup collects, per section,
+    the headline text, the body text, and any hyperlinks, and emits the
+    completed NewsArticle as soon as the section closes - no intermediate
+    section list and no second loop over the parse results.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.articles = []
+        self._current = None
+        self._in_headline = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "h3":
+            self._current = {"title": [], "content": [], "links": []}
+            self._in_headline = True
+        elif self._current is not None:
+            if tag == "a":
+                href = dict(attrs).get("href")
+                if href:
+                    self._current["links"].append(href)
+            elif tag == "hr":
+                section = self._current
+                self.articles.append(NewsArticle(
+                    title="".join(section["title"]).strip(),
+                    content="".join(section["content"]).strip(),
+                    url=section["links"][0] if section["links"] else "",
+                ))
+                self._current = None
+
+    def handle_endtag(self, tag):
+        if tag == "h3":
+            self._in_headline = False
+
+    def handle_data(self, data):
+        if self._current is None:
+            return
+        target = "title" if self._in_headline else "content"
+        self._current[target].append(data)
+
+
+def _entry_summary(feed_bytes: bytes, entry_index: int = 1) -> Optional[str]:
+    """
+    Stream-parse the feed and return the summary of one entry.
+
+    Uses iterparse and stops as soon as the requested entry has been parsed,
+    instead of materializing the whole document the way feedparser does: the
+    feed archive is multi-MB while the workflow only reads a single entry
+    near the top (each entry represents one day of news).
+
+    Args:
+        feed_bytes: Raw feed document
+        entry_index: 0-based position of the entry to read
+
+    Returns:
+        The entry's summary/description HTML, or None if the feed is shorter
+        than entry_index or the entry carries no summary.
+    """
+    seen = 0
+    for _, element in ElementTree.iterparse(io.BytesIO(feed_bytes), events=("end",)):
+        tag = element.tag.rsplit("}", 1)[-1]
+        if tag not in ("item", "entry"):
+            continue
+        if seen == entry_index:
+            return element.findtext("{*}description") or element.findtext("{*}summary")
+        seen += 1
+        element.clear()
+    return None
+
+
+async def fetch_ai_news_rss_node(state: State) -> State:
     """
     Fetches and parses the latest AI news from a specific RSS feed.
 
@@ -44,6 +216,10 @@ def fetch_ai_news_rss_node(state: State) -> State:
     extracts headlines, their corresponding content, and any links within the content.
     It stores them as a list of NewsArticle objects and returns the updated State.
 
+    The HTTP fetch runs on the async client so the download overlaps with other
+    work instead of blocking inside feedparser's urllib machinery, and extends
+    naturally to fetching several feeds concurrently.
+
     Args:
         state: Current workflow state
 
@@ -51,45 +227,146 @@ def fetch_ai_news_rss_node(state: State) -> State:
         State: Updated state containing all the fetched news articles.
     """
     print_step("Fetching AI News from RSS Feed")
+    state.current_node = "fetch_ai_news_rss"
     try:
-        feed = feedparser.parse("https://buttondown.com/ainews/rss", sanitize_html=True)
-        if not feed.entries:
-            print_step("Fetching AI News from RSS Feed", "failed - no entries found")
-            return State(error="No entries found in the RSS feed.")
-
-        # Get today's news from the first feed entry (each entry represents one day)
-        result = feed.entries[1].summary
-        headlines = re.findall(r"(?s)<h3.*?>(?P<headline>.*?)</h3>(.*?)<hr />", result)
+        cache = rss_cache.load()
+        async with httpx.AsyncClient(http2=True, timeout=10) as client:
+            response = await client.get(RSS_FEED_URL, headers=rss_cache.conditional_headers(cache))
+
+        # Feed unchanged since the last run: reuse the parsed articles
+        if response.status_code == 304 and cache.get("articles"):
+            state.news_articles = [NewsArticle(**article) for article in cache["articles"]]
+            print_step("Fetching AI News from RSS Feed", f"completed - reused {len(state.news_articles)} cached articles")
+            return state
 
-        articles = []
-        for headline, content in headlines:
-            headline_text = re.sub(r"<[^>]+>", "", headline).strip()
-            content_text = re.sub(r"<[^>]+>", "", content).strip()
-            links = re.findall(r'https?://\S+', content)
-            url = links[0] if links else ""
+        response.raise_for_status()
+        # Get today's news without parsing the rest of the feed archive
+        summary = _entry_summary(response.content)
+        if summary is None:
+            print_step("Fetching AI News from RSS Feed", "failed - no entries found")
+            state.error = "No entries found in the RSS feed."
+            return state
 
-            articles.append(NewsArticle(title=headline_text, content=content_text, url=url))
+        parser = _SummaryHTMLParser()
+        parser.feed(summary)
+        articles = parser.articles
 
+        rss_cache.save(response.headers.get("etag"), response.headers.get("last-modified"), articles)
         print_step("Fetching AI News from RSS Feed", f"completed - found {len(articles)} articles")
-        return State(news_articles=articles)
-    
+        state.news_articles = articles
     except Exception as e:
         print_step("Fetching AI News from RSS Feed", f"failed - {str(e)}")
-        return State(error=str(e))
+        state.error = str(e)
+
+    return state
+
+
+async def warm_llm_node(state: State) -> dict:
+    """
+    Fire a tiny throwaway request so the model is loaded and the connection
+    is warm before the first real LLM call.
+
+    Runs in parallel with the RSS fetch, taking the provider cold start
+    (Ollama model load, TLS handshake for hosted APIs) off the critical path.
+    Best-effort: a failed warm-up never fails the workflow.
+
+    Args:
+        state: Current workflow state (read-only here)
+
+    Returns:
+        Empty state update, so the fetch branch owns all real fields
+    """
+    print_step("Warming up LLM")
+    try:
+        await warmup_llm.ainvoke("ping")
+        print_step("Warming up LLM", "completed")
+    except Exception as e:
+        print_step("Warming up LLM", f"skipped - {str(e)}")
+    return {}
+
+
+def generation_messages(article_content: str) -> list:
+    """
+    Build the message list for a first-draft post generation.
 
+    Shared between generate_linkedin_post_node and the speculative generation
+    in choose_relevant_article_node, so both produce identical llm_cache keys.
 
-def choose_relevant_article_node(state: State) -> State:
+    Args:
+        article_content: Content of the article to write about
+
+    Returns:
+        Messages for the generation LLM call
+    """
+    return [
+        SystemMessage(content=POST_STYLE_GUIDE),
+        HumanMessage(content=f"Article to write about:\n{article_content}"),
+    ]
+
+
+def _shortlist(articles, k: int = 10):
+    """
+    Trim the raw article list before it hits the selection LLM.
+
+    Drops articles with empty content, deduplicates by normalized title and
+    leading content, and keeps the k best candidates ranked by a cheap keyword
+    prior - so the prompt carries a shortlist instead of the whole feed.
+
+    Args:
+        articles: Raw articles parsed from the feed
+        k: Maximum number of candidates to keep
+
+    Returns:
+        Deduplicated articles, best-scoring first, at most k entries
+    """
+    unique_articles = []
+    # 8-byte digests instead of the normalized strings themselves: the seen
+    # set stays a few bytes per article regardless of body size, and the
+    # digests persist cheaply if cross-run dedup is ever needed
+    seen = set()
+
+    for article in articles:
+        if not article.content:
+            continue
+        # Compare normalized title and first 200 chars to catch near-duplicates;
+        # the prefix byte keeps title and content keys in distinct key spaces
+        norm_title = article.title.casefold().strip()
+        norm_content = article.content[:200].casefold()
+        title_key = hashlib.blake2b(b"t" + norm_title.encode(), digest_size=8).digest()
+        content_key = hashlib.blake2b(b"c" + norm_content.encode(), digest_size=8).digest()
+        if title_key in seen or content_key in seen:
+            continue
+        unique_articles.append(article)
+        seen.add(title_key)
+        seen.add(content_key)
+
+    def keyword_score(article):
+        text = f"{article.title} {article.content}".lower()
+        return sum(keyword in text for keyword in RELEVANCE_KEYWORDS)
+
+    unique_articles.sort(key=keyword_score, reverse=True)
+    return unique_articles[:k]
+
+
+async def choose_relevant_article_node(state: State) -> State:
     """
     Choose the 5 most relevant AI articles from the search results.
-    
+
     Selection criteria:
     1. Scientific breakthroughs in AI
     2. Technical innovations in specific domains
     3. Recent publication (within last 4 weeks)
-    
+
+    Each shortlisted article is scored with its own small yes/no relevance
+    call, issued concurrently - cheaper and more robust than asking one long
+    prompt to emit article indices and parsing them. While the scores are in
+    flight, a post for the heuristic top candidate is generated speculatively
+    in parallel. That result lands in the shared llm cache, so if the user
+    later picks that article the generation step completes instantly.
+
     Args:
         state: Current workflow state with search results
-        
+
     Returns:
         Updated state with selected articles (up to 5)
     """
@@ -100,97 +377,92 @@ def choose_relevant_article_node(state: State) -> State:
         state.error = "No articles available to choose from"
         return state
 
-    # Filter out duplicate articles based on title and content
-    unique_articles = []
-    seen_titles = set()
-    seen_contents = set()
-    
-    for article in state.news_articles:
-        # Create a normalized version of the title and content for comparison
-        norm_title = article.title.lower().strip()
-        norm_content = article.content[:200].lower().strip()  # Compare first 200 chars to avoid duplicates with slight variations
-        
-        if norm_title not in seen_titles and norm_content not in seen_contents:
-            unique_articles.append(article)
-            seen_titles.add(norm_title)
-            seen_contents.add(norm_content)
+    # Dedupe and rank-prune so only a shortlist reaches the LLM
+    unique_articles = _shortlist(state.news_articles)
 
     if not unique_articles:
         print_step("Choosing Most Relevant Articles", "failed - no unique articles found")
         state.error = "No unique articles available to choose from"
         return state
 
-    prompt = """
-        Select the 5 most relevant articles from the provided list of news articles.
-        Respond with a comma-separated list of article numbers (0-based index, so 0 for the first article, 1 for the second, etc.).
-        Only the numbers separated by commas, so I can parse them without errors.
-        Relevance should be based on:
-
-        1. Scientific breakthroughs in Artificial Intelligence (new publications, new approaches, new models, new open-source libraries).
-        2. Technical innovations and disruptions in Artificial Intelligence for the domains: manufacturing, computer vision, robotics, and aerospace.
-        3. The article should be recent (published within the last 4 weeks).
-
-        Here are the articles to choose from:
-        {articles}
-    """
-
-    # Format articles for the prompt
-    articles_text = "\n\n".join(
-        f"{i}. {article.title}\n{article.content}\n\n"
-        for i, article in enumerate(unique_articles)
-    )
-    
     try:
-        msg = base_llm.invoke(prompt.format(articles=articles_text))
-        selected_indices = [int(idx.strip()) for idx in msg.content.split(",")]
-        
-        # Validate indices and limit to 5
-        valid_indices = [idx for idx in selected_indices if 0 <= idx < len(unique_articles)][:5]
-            
-        if not valid_indices:
-            print_step("Choosing Most Relevant Articles", "failed - no valid indices found")
-            state.error = "No valid article indices were selected"
-            return state
-            
-        state.selected_articles = [unique_articles[idx] for idx in valid_indices]
+        semaphore = asyncio.Semaphore(SCORING_CONCURRENCY)
+
+        async def score(article: NewsArticle) -> str:
+            async with semaphore:
+                messages = [
+                    SystemMessage(content=SCORING_SYSTEM_PROMPT),
+                    HumanMessage(content=f"{article.title}\n{article.content[:SELECTION_CONTENT_CHARS]}"),
+                ]
+                return await cached_ainvoke(scoring_llm, messages, namespace="score")
+
+        # Score every shortlisted article concurrently; the speculative
+        # generation for the keyword-ranked top candidate rides along.
+        results = await asyncio.gather(
+            *(score(article) for article in unique_articles),
+            cached_ainvoke(generation_llm, generation_messages(unique_articles[0].content), namespace="generate"),
+            return_exceptions=True,
+        )
+
+        answers = results[:len(unique_articles)]
+        relevant = [
+            article
+            for article, answer in zip(unique_articles, answers)
+            if isinstance(answer, str) and answer.strip().lower().startswith("yes")
+        ]
+        # The shortlist is already keyword-ranked, so ties and the empty case
+        # fall back to its head instead of failing the run
+        state.selected_articles = (relevant or unique_articles)[:5]
         print_step("Choosing Most Relevant Articles", f"completed - selected {len(state.selected_articles)} unique articles")
-    except ValueError as e:
-        print_step("Choosing Most Relevant Articles", f"failed - invalid response: {msg.content}")
-        state.error = f"Error in 'choose_relevant_article': Could not parse LLM response as integers. Response was: {msg.content}"
     except Exception as e:
         print_step("Choosing Most Relevant Articles", f"failed - {str(e)}")
         state.error = f"Unexpected error in 'choose_relevant_article': {str(e)}"
-    
+
     return state
 
 def select_article_node(state: State) -> State:
     """
     Let the user select which article to use for the LinkedIn post.
-    
+
+    When state.autoselect is set the choice is applied directly without
+    blocking on input(), so the workflow can run unattended or batched.
+
     Args:
         state: Current workflow state containing the selected articles
-        
+
     Returns:
         Updated state with the user-selected article
     """
     print_step("Selecting Article for LinkedIn Post")
     state.current_node = "select_article"
-    
+
     if not state.selected_articles:
         print_step("Selecting Article", "failed - no articles available")
         state.error = "No articles available for selection"
         return state
-    
-    # Display articles to the user
-    print("\n")
-    print_with_timestamp("📰 Available Articles:")
-    print_with_timestamp("-" * 80)
+
+    # Non-interactive path for batch runs
+    if state.autoselect is not None:
+        if 1 <= state.autoselect <= len(state.selected_articles):
+            state.linkedin_article = state.selected_articles[state.autoselect - 1]
+            print_step("Selecting Article", f"completed - auto-selected article {state.autoselect}")
+        else:
+            state.error = f"autoselect index {state.autoselect} is out of range (1-{len(state.selected_articles)})"
+            print_step("Selecting Article", f"failed - {state.error}")
+        return state
+
+    # Display articles to the user in a single stdout write: the timestamp
+    # is computed once and the loop builds strings instead of issuing a
+    # strftime + flushed print per line
+    timestamp = get_timestamp()
+    divider = "-" * 80
+    lines = [f"\n\n[{timestamp}] 📰 Available Articles:", f"[{timestamp}] {divider}"]
     for i, article in enumerate(state.selected_articles, 1):
-        print("\n")
-        print_with_timestamp(f"{i}. {article.title}")
-        print_with_timestamp(f"   {article.content[:200]}...")
-        print_with_timestamp(f"   URL: {article.url}")
-        print_with_timestamp("-" * 80)
+        lines.append(f"\n[{timestamp}] {i}. {article.title}")
+        lines.append(f"[{timestamp}]    {article.content[:200]}...")
+        lines.append(f"[{timestamp}]    URL: {article.url}")
+        lines.append(f"[{timestamp}] {divider}")
+    sys.stdout.write("\n".join(lines) + "\n")
     
     # Get user selection
     while True:
@@ -213,45 +485,11 @@ def generate_linkedin_post_node(state: State) -> State:
     Generate a LinkedIn post from the chosen article.
     """
     print_step("Generating LinkedIn Post")
-    
-    # Base prompt for post generation
-    base_prompt = """
-        Create an engaging LinkedIn post about this article. Follow these guidelines:
-
-        STRUCTURE:
-        1. Hook (1 line): Start with a compelling insight or observation
-        2. Context (2-3 lines): Connect the topic to real-world impact
-        3. Key Insights (2-4 lines): Share main takeaways in clear, concise points
-        4. Value (1 line): Highlight professional significance
-        5. Call to Action: End with an engaging question or prompt
-
-        WRITING STYLE:
-        - Use clear, straightforward language
-        - Write short, impactful sentences
-        - Organize ideas with bullet points
-        - Add frequent line breaks between concepts
-        - Use active voice
-        - Focus on practical, actionable insights
-        - Support points with specific examples or data
-        - Address the reader directly using "you" and "your"
-        - Pose thought-provoking questions
-        - Skip introductory phrases like "in conclusion" or "in summary"
-        - Avoid warnings, notes, or unnecessary extras
-
-        AVOID:
-        - Emojis, hashtags, semicolons, and asterisks
-        - Clichés and metaphors
-        - Broad generalizations
-        - Passive voice
-        - These words: Accordingly, Additionally, Arguably, Certainly, Consequently, Hence, However, Indeed, Moreover, Nevertheless, Nonetheless, Notwithstanding, Thus, Undoubtedly, Adept, Commendable, Dynamic
-    """
 
     # If we have previous feedback, incorporate it
     if state.quality_evaluation and state.needs_rewrite:
         print_step("Generating LinkedIn Post", "rewriting based on user feedback")
-        prompt = f"""
-            {base_prompt}
-
+        user_prompt = f"""
             The previous version of the post needs improvement based on user feedback.
             Here's the context:
 
@@ -260,18 +498,48 @@ def generate_linkedin_post_node(state: State) -> State:
 
             User Feedback:
             {state.quality_evaluation['feedback']}
-            
+
             Article to write about:
-            {{article}}
+            {state.linkedin_article.content}
 
             Please generate an improved version of the post that addresses the user's feedback while maintaining the same high-quality structure and style.
         """
+        messages = [
+            SystemMessage(content=POST_STYLE_GUIDE),
+            HumanMessage(content=user_prompt),
+        ]
     else:
-        prompt = f"{base_prompt}\n\nArticle to write about:\n{{article}}"
+        # Same messages as the speculative call in choose_relevant_article_node,
+        # so a correct speculation turns this into a cache hit
+        messages = generation_messages(state.linkedin_article.content)
 
     try:
-        msg = base_llm.invoke(prompt.format(article=state.linkedin_article.content))
-        state.linkedin_post = msg.content
+        # Stream the generation to stdout and write ahead to the output file:
+        # the user watches the post appear instead of staring at a blank wait
+        # (and can Ctrl-C early), and a partial post survives an interrupt
+        with open("linkedin_post.txt", "w", encoding="utf-8") as f:
+            def write_partial(chunk: str) -> None:
+                sys.stdout.write(chunk)
+                sys.stdout.flush()
+                f.write(chunk)
+                f.flush()
+
+            state.linkedin_post = cached_stream(
+                generation_llm, messages, namespace="generate", on_token=write_partial
+            )
+
+        # Enforce the banned-word list client-side with a targeted resample
+        for _ in range(BANNED_WORD_RETRIES):
+            found = sorted(set(word.casefold() for word in _BANNED_WORDS_RE.findall(state.linkedin_post)))
+            if not found:
+                break
+            print_step("Generating LinkedIn Post", f"rewriting - banned words used: {', '.join(found)}")
+            retry_messages = messages + [
+                AIMessage(content=state.linkedin_post),
+                HumanMessage(content=f"Rewrite the post without using these words: {', '.join(found)}. Keep everything else unchanged."),
+            ]
+            state.linkedin_post = cached_invoke(generation_llm, retry_messages, namespace="generate")
+
         print_step("Generating LinkedIn Post", "completed")
     except Exception as e:
         print_step("Generating LinkedIn Post", f"failed - {str(e)}")
@@ -285,21 +553,37 @@ def get_user_feedback_node(state: State) -> State:
     Get user feedback on the generated LinkedIn post.
     This is a human-in-the-loop node that allows users to provide feedback
     and decide whether to save or improve the post.
-    
+
+    When state.autofeedback is set the node never blocks on input(): a
+    non-empty string triggers exactly one rewrite round with that feedback,
+    an empty string approves the post as-is.
+
     Args:
         state: Current workflow state containing the LinkedIn post
-        
+
     Returns:
         Updated state with user feedback and rewrite decision
     """
     print_step("Getting User Feedback")
     state.current_node = "get_user_feedback"
-    
+
     if not state.linkedin_post:
         print_step("Getting User Feedback", "failed - no post available")
         state.error = "No LinkedIn post available for feedback"
         return state
-    
+
+    # Non-interactive path for batch runs
+    if state.autofeedback is not None:
+        if state.autofeedback:
+            state.quality_evaluation = {"feedback": state.autofeedback}
+            state.needs_rewrite = True
+            state.autofeedback = ""  # one rewrite round, then auto-approve
+            print_step("Getting User Feedback", "completed - applied scripted feedback")
+        else:
+            state.needs_rewrite = False
+            print_step("Getting User Feedback", "completed - post auto-approved")
+        return state
+
     # Show the generated post to the user
     print("\n")
     print("-" * 80)
@@ -332,29 +616,29 @@ def get_user_feedback_node(state: State) -> State:
     return state
 
 
-def gather_additional_info_node(state: State) -> State:
+async def gather_additional_info_node(state: State) -> State:
     """
     Gather additional information using Tavily search when needed.
-    
+
     Args:
         state: Current workflow state containing quality evaluation results
-        
+
     Returns:
         Updated state with additional information
     """
     print_step("Gathering Additional Information")
     state.current_node = "gather_additional_info"
-    
+
     if not state.needs_rewrite:
         print_step("Gathering Additional Information", "skipped - not needed")
         return state
-        
+
     try:
         from tools import gather_additional_info
-        
+
         # Create a search query based on the article title and content
         search_query = f"{state.linkedin_article.title} {state.linkedin_article.content[:200]}"
-        state.additional_info = gather_additional_info(search_query)
+        state.additional_info = await gather_additional_info(search_query)
         print_step("Gathering Additional Information", "completed")
     except Exception as e:
         print_step("Gathering Additional Information", f"failed - {str(e)}")
@@ -376,10 +660,26 @@ def save_linkedin_post_node(state: State) -> State:
     """
     print_step("Saving LinkedIn Post")
     state.current_node = "save_linkedin_post"
-    
+
     try:
-        with open("linkedin_post.txt", "w", encoding="utf-8") as f:
-            f.write(state.linkedin_post)
+        path = "linkedin_post.txt"
+        post_bytes = state.linkedin_post.encode("utf-8")
+
+        # Skip the write entirely if the file already holds this content
+        # (blake2b is the fastest stdlib hash for short inputs)
+        try:
+            with open(path, "rb") as f:
+                if hashlib.blake2b(f.read()).digest() == hashlib.blake2b(post_bytes).digest():
+                    print_step("Saving LinkedIn Post", "skipped - content unchanged")
+                    return state
+        except OSError:
+            pass
+
+        # Write to a tempfile and rename so an interrupted run can't leave a
+        # half-written post behind
+        with open(path + ".tmp", "wb") as f:
+            f.write(post_bytes)
+        os.replace(path + ".tmp", path)
         print_step("Saving LinkedIn Post", "completed")
     except Exception as e:
         print_step("Saving LinkedIn Post", f"failed - {str(e)}")
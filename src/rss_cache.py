@@ -0,0 +1,72 @@
+"""
+On-disk cache for the RSS feed.
+
+The feed changes roughly once a day while the workflow is often re-run many
+times in between (development, debugging, rewrite loops). Persisting the
+HTTP validators (ETag / Last-Modified) together with the last parsed article
+list lets repeat runs issue a conditional GET and, on 304 Not Modified, skip
+the download and the HTML parsing entirely.
+"""
+
+import json
+from dataclasses import asdict
+from pathlib import Path
+from typing import List, Optional
+
+from state import NewsArticle
+
+CACHE_FILE = Path.home() / ".cache" / "linkedin_rss" / "feed.json"
+
+
+def load() -> dict:
+    """
+    Load the cached feed state from disk.
+
+    Returns:
+        dict with "etag", "last_modified" and "articles" keys,
+        or an empty dict if no (readable) cache exists.
+    """
+    try:
+        return json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save(etag: Optional[str], last_modified: Optional[str], articles: List[NewsArticle]) -> None:
+    """
+    Persist the feed validators and parsed articles for the next run.
+
+    Args:
+        etag: ETag response header, if the server sent one
+        last_modified: Last-Modified response header, if the server sent one
+        articles: Articles parsed from the current feed body
+    """
+    payload = {
+        "etag": etag,
+        "last_modified": last_modified,
+        "articles": [asdict(article) for article in articles],
+    }
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        CACHE_FILE.write_text(json.dumps(payload), encoding="utf-8")
+    except OSError:
+        # A broken cache should never break the workflow itself
+        pass
+
+
+def conditional_headers(cache: dict) -> dict:
+    """
+    Build If-None-Match / If-Modified-Since headers from a cached state.
+
+    Validators are only sent when the cache also holds articles to serve:
+    a 304 answered from an empty cache would leave nothing to fall back on
+    (and httpx treats an unhandled 304 as an error in raise_for_status).
+    """
+    headers = {}
+    if not cache.get("articles"):
+        return headers
+    if cache.get("etag"):
+        headers["If-None-Match"] = cache["etag"]
+    if cache.get("last_modified"):
+        headers["If-Modified-Since"] = cache["last_modified"]
+    return headers
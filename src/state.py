@@ -1,23 +1,31 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional, Literal
+from dataclasses import dataclass
+from typing import List, Optional
 from langgraph.graph import START
 
-class NewsArticle(BaseModel):
-    title: str = Field(default="", description="Title of the news article")
-    content: str = Field(default="", description="Content of the news article")
-    type: str = Field(default="general", description="Type of the news article (e.g. general, scientific publication, X / Twitter feed)")
-    url: str = Field(default="", description="URL of the news article")
 
+@dataclass(slots=True, frozen=True)
+class NewsArticle:
+    """A single news article extracted from the feed."""
+    title: str = ""
+    content: str = ""
+    type: str = "general"  # e.g. general, scientific publication, X / Twitter feed
+    url: str = ""
 
-# Graph State
-class State(BaseModel):
-    search_results: Optional[List[dict]] = Field(default=None, description="List of search results")
-    news_articles: Optional[List[NewsArticle]] = Field(default=None, description="List of news articles")
-    selected_articles: Optional[List[NewsArticle]] = Field(default=None, description="List of selected articles for user choice")
-    linkedin_article: Optional[NewsArticle] = Field(default=None, description="Article for LinkedIn post generation")
-    linkedin_post: Optional[str] = Field(default=None, description="LinkedIn post generated from the article")
-    current_node: Optional[str] = Field(default=START, description="Current node in the workflow")
-    error: Optional[str] = Field(default=None, description="Error message if any")
-    quality_evaluation: Optional[dict] = Field(default=None, description="User feedback for post improvement")
-    needs_rewrite: Optional[bool] = Field(default=False, description="Whether the post needs to be rewritten")
-    
\ No newline at end of file
+
+# Graph State. Plain slotted dataclasses instead of pydantic models: the state
+# is copied between nodes on every transition, and these are passive data
+# carriers that don't need per-field validation on each construction.
+@dataclass(slots=True)
+class State:
+    search_results: Optional[List[dict]] = None
+    news_articles: Optional[List[NewsArticle]] = None
+    selected_articles: Optional[List[NewsArticle]] = None  # articles offered for user choice
+    linkedin_article: Optional[NewsArticle] = None  # article for LinkedIn post generation
+    linkedin_post: Optional[str] = None
+    current_node: Optional[str] = START
+    error: Optional[str] = None
+    quality_evaluation: Optional[dict] = None  # user feedback for post improvement
+    needs_rewrite: Optional[bool] = False
+    additional_info: Optional[str] = None  # extra context gathered for rewrites
+    autoselect: Optional[int] = None  # 1-based article choice for non-interactive runs
+    autofeedback: Optional[str] = None  # scripted feedback ("" = approve) for non-interactive runs
@@ -1,6 +1,7 @@
+import functools
+from dataclasses import asdict
 from typing import List, Dict
 import feedparser
-from datetime import datetime
 
 from langchain_community.tools import TavilySearchResults
 from state import NewsArticle
@@ -24,31 +25,31 @@ def fetch_rss_feed(url: str, limit: int = 50) -> List[Dict[str, str]]:
             article = NewsArticle(
                 title=entry.title,
                 url=entry.link,
-                summary=entry.get('summary', ''),
-                published_date=entry.get('published', datetime.now().isoformat()),
-                source=feed.feed.title
+                content=entry.get('summary', '')
             )
-            articles.append(article.model_dump())
+            articles.append(asdict(article))
             
         return articles
     except Exception as e:
         return [{"error": f"Failed to fetch RSS feed: {str(e)}"}]
 
 
-def gather_additional_info(query: str, max_results: int = 3) -> str:
+async def gather_additional_info(query: str, max_results: int = 3) -> str:
     """
     Gather additional information using Tavily search.
-    
+
+    Async so the network round-trip can overlap with other workflow I/O.
+
     Args:
         query: The search query
         max_results: Maximum number of search results to return
-        
+
     Returns:
         Combined information from search results
     """
     tool = tavily_search_tool(max_results=max_results)
     try:
-        results = tool({"query": query})
+        results = await tool.ainvoke({"query": query})
         
         # Combine information from search results
         combined_info = []
@@ -63,8 +64,13 @@ def gather_additional_info(query: str, max_results: int = 3) -> str:
         return f"Error gathering additional information: {str(e)}"
 
 
+@functools.lru_cache(maxsize=None)
 def tavily_search_tool(max_results: int = 5, search_depth: str = "advanced", include_answer: bool = True, include_raw_content: bool = True, include_images: bool = True) -> TavilySearchResults:
-    """Tool to search the web for additional information about a topic."""
+    """
+    Tool to search the web for additional information about a topic.
+    Memoized so repeated gather_additional_info calls share one tool
+    instance (and its keep-alive HTTP client) per parameter combination.
+    """
     return TavilySearchResults(
         max_results=max_results,
         search_depth=search_depth,